@@ -48,6 +48,7 @@ function(uipc_show_options)
     message(STATUS "    * UIPC_BUILD_PYBIND: ${UIPC_BUILD_PYBIND}")
     message(STATUS "    * UIPC_BUILD_PYTHON_WHEEL: ${UIPC_BUILD_PYTHON_WHEEL}")
     message(STATUS "    * UIPC_USING_LOCAL_VCPKG: ${UIPC_USING_LOCAL_VCPKG}")
+    message(STATUS "    * UIPC_USING_CCACHE: ${UIPC_USING_CCACHE}")
     message(STATUS "    * UIPC_BUILD_EXAMPLES: ${UIPC_BUILD_EXAMPLES}")
     message(STATUS "    * UIPC_BUILD_TESTS: ${UIPC_BUILD_TESTS}")
     message(STATUS "    * UIPC_BUILD_BENCHMARKS: ${UIPC_BUILD_BENCHMARKS}")
@@ -57,6 +58,7 @@ function(uipc_show_options)
 
     message(STATUS "    * UIPC_WITH_VDB_SUPPORT: ${UIPC_WITH_VDB_SUPPORT}")
     message(STATUS "    * UIPC_PYTHON_EXECUTABLE_PATH: ${UIPC_PYTHON_EXECUTABLE_PATH}")
+    message(STATUS "    * UIPC_LINK_JOB_POOL_SIZE: ${UIPC_LINK_JOB_POOL_SIZE}")
 
     message(STATUS "Backend Options:")
     message(STATUS "    * UIPC_WITH_CUDA_BACKEND: ${UIPC_WITH_CUDA_BACKEND}")
@@ -163,6 +165,47 @@ function(uipc_config_vcpkg_install)
     set(VCPKG_INSTALLED_DIR "${VCPKG_INSTALLED_DIR}" PARENT_SCOPE)
 endfunction()
 
+# -----------------------------------------------------------------------------------------
+# Config the job pools: throttle the memory-hungry link steps independently of the
+# compile parallelism (CMAKE_BUILD_PARALLEL_LEVEL / --parallel). Only Ninja supports it.
+# -----------------------------------------------------------------------------------------
+function(uipc_config_job_pools)
+    if ("${UIPC_LINK_JOB_POOL_SIZE}" STREQUAL "")
+        return()
+    endif()
+    if (NOT UIPC_LINK_JOB_POOL_SIZE MATCHES "^[1-9][0-9]*$")
+        uipc_error("UIPC_LINK_JOB_POOL_SIZE must be a positive integer, but got '${UIPC_LINK_JOB_POOL_SIZE}'.")
+    endif()
+    if (NOT CMAKE_GENERATOR MATCHES "Ninja")
+        uipc_warning("UIPC_LINK_JOB_POOL_SIZE is ignored, job pools require a Ninja generator (got ${CMAKE_GENERATOR}).")
+        return()
+    endif()
+    set_property(GLOBAL APPEND PROPERTY JOB_POOLS uipc_link_pool=${UIPC_LINK_JOB_POOL_SIZE})
+    set(CMAKE_JOB_POOL_LINK uipc_link_pool PARENT_SCOPE)
+    uipc_info("Link job pool size: ${UIPC_LINK_JOB_POOL_SIZE}")
+endfunction()
+
+# -----------------------------------------------------------------------------------------
+# Config the compiler launcher: wrap C/C++/CUDA compiles with ccache (or sccache) when
+# found, so warm rebuilds hit the cache. Launchers set by the user are kept as they are.
+# -----------------------------------------------------------------------------------------
+function(uipc_config_compiler_launcher)
+    if (NOT UIPC_USING_CCACHE)
+        return()
+    endif()
+    find_program(UIPC_CCACHE_PROGRAM NAMES ccache sccache)
+    if (NOT UIPC_CCACHE_PROGRAM)
+        uipc_info("ccache/sccache not found, compiling without a compiler launcher.")
+        return()
+    endif()
+    foreach(LANG C CXX CUDA)
+        if ("${CMAKE_${LANG}_COMPILER_LAUNCHER}" STREQUAL "" AND "$ENV{CMAKE_${LANG}_COMPILER_LAUNCHER}" STREQUAL "")
+            set(CMAKE_${LANG}_COMPILER_LAUNCHER "${UIPC_CCACHE_PROGRAM}" PARENT_SCOPE)
+        endif()
+    endforeach()
+    uipc_info("Compiler launcher: ${UIPC_CCACHE_PROGRAM}")
+endfunction()
+
 # -----------------------------------------------------------------------------------------
 # Set the output directory for the target
 # -----------------------------------------------------------------------------------------
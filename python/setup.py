@@ -82,6 +82,19 @@ class BuildPyCommand(build_py):
         print("WARNING: No build configuration directory found")
         return None
 
+    @staticmethod
+    def _copy_if_changed(src_file, dst_dir):
+        """Copy a file into dst_dir, skip it if the previous copy2 is still up to date."""
+        dst_file = Path(dst_dir) / src_file.name
+        if dst_file.exists():
+            src_stat = src_file.stat()
+            dst_stat = dst_file.stat()
+            # copy2 preserves mtime, so same size and mtime means the same file
+            if src_stat.st_size == dst_stat.st_size and src_stat.st_mtime_ns == dst_stat.st_mtime_ns:
+                return False
+        shutil.copy2(src_file, dst_file)
+        return True
+
     def _copy_vcpkg_deps(self, vcpkg_triplet, shared_lib_ext, modules_dir):
         """Copy vcpkg dependencies to modules directory."""
         vcpkg_paths = [
@@ -97,8 +110,10 @@ class BuildPyCommand(build_py):
                 print(f"Copying vcpkg dependencies from: {vcpkg_path}")
                 for lib_file in vcpkg_path.glob(f"*{shared_lib_ext}"):
                     try:
-                        shutil.copy2(lib_file, modules_dir)
-                        print(f"  Copied {lib_file.name}")
+                        if self._copy_if_changed(lib_file, modules_dir):
+                            print(f"  Copied {lib_file.name}")
+                        else:
+                            print(f"  Up to date {lib_file.name}")
                         copied_count += 1
                     except Exception as e:
                         print(f"  WARNING: Failed to copy {lib_file.name}: {e}")
@@ -119,8 +134,10 @@ class BuildPyCommand(build_py):
                 print(f"Copying shared libraries from: {lib_path}")
                 for lib_file in lib_path.glob(f"*{shared_lib_ext}"):
                     try:
-                        shutil.copy2(lib_file, modules_dir)
-                        print(f"  Copied {lib_file.name}")
+                        if self._copy_if_changed(lib_file, modules_dir):
+                            print(f"  Copied {lib_file.name}")
+                        else:
+                            print(f"  Up to date {lib_file.name}")
                         copied_count += 1
                     except Exception as e:
                         print(f"  WARNING: Failed to copy {lib_file.name}: {e}")
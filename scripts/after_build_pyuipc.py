@@ -5,6 +5,8 @@ import argparse as ap
 import pathlib
 import pybind11_stubgen as stubgen
 import subprocess as sp
+import importlib.util
+from importlib import metadata
 import optional_import # help stubgen to detect optional modules' api
 
 def is_option_on(option: str):
@@ -123,17 +125,33 @@ def generate_uipc_stubs(binary_dir):
         sys.exit(1)
 
 def uninstall_package():
-    # check if the package is installed
-    ret = sp.run([sys.executable, '-m', 'pip', 'show', 'pyuipc'], capture_output=True, text=True)
-    if ret.returncode == 0:
-        print(f'Uninstalling the old package:')
-        ret = sp.check_call([sys.executable, '-m', 'pip', 'uninstall', '-y', 'pyuipc'])
-        if ret != 0:
-            print(f'Error uninstalling package: {ret}')
-            sys.exit(1)
+    # check if the package is installed, read the distribution metadata instead of spawning `pip show`
+    try:
+        metadata.distribution('pyuipc')
+    except metadata.PackageNotFoundError:
+        return
+    print(f'Uninstalling the old package:')
+    ret = sp.check_call([sys.executable, '-m', 'pip', 'uninstall', '-y', 'pyuipc'])
+    if ret != 0:
+        print(f'Error uninstalling package: {ret}')
+        sys.exit(1)
+
+def can_build_without_isolation():
+    # python/pyproject.toml builds with setuptools>=61 and wheel (bdist_wheel is bundled in setuptools>=70.1)
+    try:
+        setuptools_version = tuple(int(v) for v in metadata.version('setuptools').split('.')[:2])
+    except (metadata.PackageNotFoundError, ValueError):
+        return False
+    if setuptools_version < (61, 0):
+        return False
+    return setuptools_version >= (70, 1) or importlib.util.find_spec('wheel') is not None
 
 def install_package(binary_dir):
-    ret = sp.check_call([sys.executable, '-m', 'pip', 'install', f'{binary_dir}/python'])
+    cmd = [sys.executable, '-m', 'pip', 'install', f'{binary_dir}/python']
+    # reuse the build backend of the current environment instead of creating an isolated one on every build
+    if can_build_without_isolation():
+        cmd.append('--no-build-isolation')
+    ret = sp.check_call(cmd)
     if ret != 0:
         print(f'''Automatically installing the package failed.
 Please install the package manually by running:
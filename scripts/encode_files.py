@@ -1,13 +1,14 @@
 import os
 import pathlib
 import shutil
+import subprocess
 # local
 red         = "\033[131m"
 off         = "\033[00m"
 
 subfix = ['.cpp','.hpp','.h','.c','.cu','.cuh']
 
-if(os.system("iconv --version") != 0):
+if(shutil.which("iconv") is None):
     print("[iconv] not found, please install it first")
     exit(1)
 
@@ -31,7 +32,10 @@ for root, dirs, files in os.walk("."):
         if(s in subfix):
             fullname = os.path.join(root, file)
             fullnametemp = fullname + ".tmp"
-            if(os.system("iconv -t UTF-8 " + fullname + " > " + fullnametemp) == 0):
+            # run iconv directly instead of through a shell, also safe for paths with spaces
+            with open(fullnametemp, "wb") as out:
+                ret = subprocess.run(["iconv", "-t", "UTF-8", fullname], stdout=out).returncode
+            if(ret == 0):
                 shutil.copy(fullnametemp, fullname)
             else:
                 fail_list.append( pathlib.Path(fullname).absolute())
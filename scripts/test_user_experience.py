@@ -22,6 +22,7 @@ class UserExperienceTest:
         self.wheel_path = wheel_path
         self.use_pypi = use_pypi
         self.test_env = None
+        self.sample_usage_ok = None
         
     def create_clean_environment(self):
         """Create a clean virtual environment for testing"""
@@ -31,10 +32,10 @@ class UserExperienceTest:
         self.test_env = tempfile.mkdtemp(prefix="libuipc_test_")
         venv_path = os.path.join(self.test_env, "venv")
         
-        # Create virtual environment
+        # Create virtual environment, only stderr is reported on failure
         result = subprocess.run([
             sys.executable, "-m", "venv", venv_path
-        ], capture_output=True, text=True)
+        ], stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
         
         if result.returncode != 0:
             print(f"Failed to create virtual environment: {result.stderr}")
@@ -67,20 +68,25 @@ class UserExperienceTest:
             cmd = [self.pip_exe, "install", self.wheel_path]
             print(f"Installing from local wheel: {self.wheel_path}")
             
-        result = subprocess.run(cmd, capture_output=True, text=True)
-        
+        # Stream pip output directly instead of buffering it and printing it afterwards
+        sys.stdout.flush()
+        result = subprocess.run(cmd)
+
         if result.returncode != 0:
-            print(f"[ERROR] Installation failed:")
-            print(f"STDOUT: {result.stdout}")
-            print(f"STDERR: {result.stderr}")
+            print(f"[ERROR] Installation failed with exit code {result.returncode}")
             return False
         else:
             print("[OK] Installation completed successfully")
-            print(f"Output: {result.stdout}")
             return True
     
     def test_basic_import(self):
-        """Test basic package import"""
+        """
+        Test basic package import
+        
+        The sample usage checks run in the same interpreter. They print a
+        SAMPLE_USAGE_OK marker line on success, which is recorded in
+        self.sample_usage_ok for test_sample_usage to report.
+        """
         print("\nTesting basic import...")
         
         test_script = '''
@@ -96,20 +102,40 @@ try:
         print("? No version information found")
         
     print(f"[OK] Package location: {uipc.__file__}")
-    sys.exit(0)
 except ImportError as e:
     print(f"[ERROR] Failed to import uipc: {e}")
     sys.exit(1)
 except Exception as e:
     print(f"[ERROR] Unexpected error: {e}")
     sys.exit(1)
+
+# Sample usage, reuse the imported package instead of starting another interpreter
+try:
+    # Test basic functionality (if available)
+    # Add specific tests based on LibUIPC API
+    
+    # For now, just check if basic attributes/modules are accessible
+    attrs_to_check = ['__file__', '__name__']
+    for attr in attrs_to_check:
+        if hasattr(uipc, attr):
+            print(f"[OK] Has attribute: {attr}")
+        
+    print("[OK] Basic functionality test completed")
+    print("SAMPLE_USAGE_OK")
+except Exception as e:
+    print(f"[ERROR] Sample usage test failed: {e}")
+    import traceback
+    traceback.print_exc()
+sys.exit(0)
 '''
         
         result = subprocess.run([
             self.python_exe, "-c", test_script
         ], capture_output=True, text=True)
         
-        print(result.stdout)
+        lines = result.stdout.splitlines()
+        self.sample_usage_ok = result.returncode == 0 and "SAMPLE_USAGE_OK" in lines
+        print("\n".join(line for line in lines if line != "SAMPLE_USAGE_OK"))
         if result.stderr:
             print(f"Warnings/Errors: {result.stderr}")
             
@@ -177,42 +203,19 @@ else:
         return result.returncode == 0
     
     def test_sample_usage(self):
-        """Test basic functionality usage"""
+        """Report the sample usage result recorded by test_basic_import (SAMPLE_USAGE_OK marker)"""
         print("\nTesting sample usage...")
         
-        test_script = '''
-try:
-    import uipc
-    print("[OK] Package imported successfully")
-    
-    # Test basic functionality (if available)
-    # Add specific tests based on LibUIPC API
-    
-    # For now, just check if basic attributes/modules are accessible
-    attrs_to_check = ['__file__', '__name__']
-    for attr in attrs_to_check:
-        if hasattr(uipc, attr):
-            print(f"[OK] Has attribute: {attr}")
-        
-    print("[OK] Basic functionality test completed")
-    exit(0)
-    
-except Exception as e:
-    print(f"[ERROR] Sample usage test failed: {e}")
-    import traceback
-    traceback.print_exc()
-    exit(1)
-'''
-        
-        result = subprocess.run([
-            self.python_exe, "-c", test_script
-        ], capture_output=True, text=True)
+        # The checks already ran in the interpreter started by test_basic_import
+        if self.sample_usage_ok is None:
+            print("[ERROR] Sample usage requires the basic import test to run first")
+            return False
         
-        print(result.stdout)
-        if result.stderr:
-            print(f"Warnings/Errors: {result.stderr}")
-            
-        return result.returncode == 0
+        if self.sample_usage_ok:
+            print("[OK] Sample usage checks passed (see basic import output)")
+        else:
+            print("[ERROR] Sample usage checks failed (see basic import output)")
+        return self.sample_usage_ok
     
     def test_documentation_access(self):
         """Test if documentation/help is accessible"""